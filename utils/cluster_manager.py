@@ -8,15 +8,41 @@ import logging
 import os
 import random
 import re
+import select
+import shutil
 import signal
 import socket
 import string
 import subprocess
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+# Resolved lazily on first use - invocations that never emit JSON (stop,
+# --help) shouldn't pay for probing the optional orjson dependency
+_json_encoder = None
+
+
+def _json_dumps(obj) -> str:
+    global _json_encoder
+    if _json_encoder is None:
+        try:
+            # Optional: ~3-5x faster JSON encoding when available
+            import orjson
+
+            def _json_encoder(o):
+                return orjson.dumps(o).decode()
+
+        except ImportError:
+            _json_encoder = json.dumps
+    return _json_encoder(obj)
+
+
 LOG_LEVELS = {
     "critical": logging.CRITICAL,
     "error": logging.ERROR,
@@ -36,71 +62,88 @@ SERVER_CRT = f"{TLS_FOLDER}/server.crt"
 SERVER_KEY = f"{TLS_FOLDER}/server.key"
 
 
-def get_command(commands: List[str]) -> str:
+@lru_cache(maxsize=None)
+def get_command(commands: Tuple[str, ...]) -> str:
+    # shutil.which walks $PATH in-process, avoiding a fork/exec per candidate
     for command in commands:
-        try:
-            result = subprocess.run(
-                ["which", command],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            if result.returncode == 0:
-                return command
-        except Exception as e:
-            logging.error(f"Error checking {command}: {e}")
+        if shutil.which(command):
+            return command
     raise Exception(f"Neither {' nor '.join(commands)} found in the system.")
 
 
-# Global variables for caching server commands (set lazily)
-_SERVER_COMMAND = None
-_CLI_COMMAND = None
-
-
 def get_server_command() -> str:
     """Get server command, checking valkey-server first, then redis-server"""
-    global _SERVER_COMMAND
-    if _SERVER_COMMAND is None:
-        _SERVER_COMMAND = get_command(["valkey-server", "redis-server"])
-    return _SERVER_COMMAND
+    return get_command(("valkey-server", "redis-server"))
 
 
 def get_cli_command() -> str:
     """Get CLI command, checking valkey-cli first, then redis-cli"""
-    global _CLI_COMMAND
-    if _CLI_COMMAND is None:
-        _CLI_COMMAND = get_command(["valkey-cli", "redis-cli"])
-    return _CLI_COMMAND
+    return get_command(("valkey-cli", "redis-cli"))
+
+
+@lru_cache(maxsize=8)
+def get_server_version(server_name: str) -> Tuple[int, ...]:
+    # The version is constant for the lifetime of a run, so it's resolved
+    # once per binary instead of once per started node
+    result = subprocess.run([server_name, "--version"], capture_output=True, text=True)
+    version_output = result.stdout
+    version_match = re.search(
+        r"server v=(\d+\.\d+\.\d+)", version_output, re.IGNORECASE
+    )
+    if version_match:
+        return tuple(map(int, version_match.group(1).split(".")))
+    raise Exception("Unable to determine server version.")
+
+
+# Log files that already have a handler attached, so repeated init_logger
+# calls (e.g. per-cluster in a multi-cluster teardown) don't stack duplicates.
+# The lock covers the check-and-add: stop_cluster runs on worker threads, and
+# with a shared --logfile two of them could otherwise both pass the check and
+# attach two truncating handlers for the same file
+_INITIALIZED_LOG_FILES = set()
+_INIT_LOGGER_LOCK = threading.Lock()
 
 
 def init_logger(logfile: str):
-    print(f"LOG_FILE={logfile}")
-    root_logger = logging.getLogger()
-    handler = logging.FileHandler(logfile, "w", "utf-8")
-    root_logger.addHandler(handler)
+    with _INIT_LOGGER_LOCK:
+        if logfile in _INITIALIZED_LOG_FILES:
+            return
+        _INITIALIZED_LOG_FILES.add(logfile)
+        print(f"LOG_FILE={logfile}")
+        root_logger = logging.getLogger()
+        handler = logging.FileHandler(logfile, "w", "utf-8")
+        # Let the handler stamp records lazily - %(asctime)s is only formatted
+        # when a record is actually emitted, unlike building a
+        # datetime.now(timezone.utc) string at every call site
+        formatter = logging.Formatter(
+            "%(asctime)s.%(msecs)03dZ %(levelname)s %(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%S",
+        )
+        formatter.converter = time.gmtime
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
 
 
-def check_if_tls_cert_exist(tls_file: str, timeout: int = 15):
-    timeout_start = time.time()
-    while time.time() < timeout_start + timeout:
-        if os.path.exists(tls_file):
-            return True
-        else:
-            time.sleep(0.005)
-    logging.warn(f"Timed out waiting for certificate file {tls_file}")
-    return False
+def check_if_tls_cert_exist(tls_file: str) -> bool:
+    # No waiting here - this runs before any cert generation is kicked off,
+    # so if the file isn't there now, nothing is about to create it
+    return os.path.exists(tls_file)
 
 
-def check_if_tls_cert_is_valid(tls_file: str):
-    file_creation_unix_time = os.path.getmtime(tls_file)
-    file_creation_utc = datetime.fromtimestamp(file_creation_unix_time)
-    current_time_utc = datetime.utcnow()
-    time_since_created = current_time_utc - file_creation_utc
-    return time_since_created.days < 3650
+# The generated certificates are valid for 3650 days
+TLS_CERT_VALIDITY_SECONDS = 3650 * 86400
 
 
+def check_if_tls_cert_is_valid(tls_file: str) -> bool:
+    # Plain epoch arithmetic - timestamps are timezone-free, so no datetime
+    # objects are needed
+    return (time.time() - os.path.getmtime(tls_file)) < TLS_CERT_VALIDITY_SECONDS
+
+
+@lru_cache(maxsize=1)
 def should_generate_new_tls_certs() -> bool:
-    # Returns False if we already have existing and valid TLS files, otherwise True
+    # Returns False if we already have existing and valid TLS files, otherwise True.
+    # Cached - once decided within a process, the answer doesn't change.
     try:
         Path(TLS_FOLDER).mkdir(exist_ok=False)
     except FileExistsError:
@@ -124,8 +167,8 @@ def generate_tls_certs():
     f.write("keyUsage = digitalSignature, keyEncipherment")
     f.close()
 
-    def make_key(name: str, size: int):
-        p = subprocess.Popen(
+    def make_key(name: str, size: int) -> subprocess.Popen:
+        return subprocess.Popen(
             [
                 "openssl",
                 "genrsa",
@@ -133,24 +176,24 @@ def generate_tls_certs():
                 name,
                 str(size),
             ],
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
         )
+
+    # Build the CA key and the server key concurrently - they're independent
+    # and are the slowest steps of the pipeline
+    key_procs = [make_key(ca_key, 4096), make_key(SERVER_KEY, 2048)]
+    for p in key_procs:
         # ARM64 runners take longer to generate TLS certificates, and sometimes fail if the timeout shorter (10 seconds).
-        output, err = p.communicate(timeout=20)
+        _, err = p.communicate(timeout=20)
         if p.returncode != 0:
             raise Exception(
-                f"Failed to make key for {name}. Executed: {str(p.args)}:\n{err}"
+                f"Failed to make key. Executed: {str(p.args)}:\n{err}"
             )
 
-    # Build CA key
-    make_key(ca_key, 4096)
-
-    # Build server key
-    make_key(SERVER_KEY, 2048)
-
-    # Build CA Cert
+    # Build CA Cert. The CSR for the server cert (below) only depends on the
+    # server key, so it is spawned in parallel with this step.
     p = subprocess.Popen(
         [
             "openssl",
@@ -168,15 +211,10 @@ def generate_tls_certs():
             "-out",
             CA_CRT,
         ],
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
         text=True,
     )
-    output, err = p.communicate(timeout=10)
-    if p.returncode != 0:
-        raise Exception(
-            f"Failed to make create CA cert. Executed: {str(p.args)}:\n{err}"
-        )
 
     # Read server key
     p1 = subprocess.Popen(
@@ -191,12 +229,15 @@ def generate_tls_certs():
             SERVER_KEY,
         ],
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
-    _key_output, err = p.communicate(timeout=10)
+
+    _, err = p.communicate(timeout=10)
     if p.returncode != 0:
-        raise Exception(f"Failed to read server key. Executed: {str(p.args)}:\n{err}")
+        raise Exception(
+            f"Failed to make create CA cert. Executed: {str(p.args)}:\n{err}"
+        )
 
     # Build server cert
     p = subprocess.Popen(
@@ -219,19 +260,25 @@ def generate_tls_certs():
             "-out",
             SERVER_CRT,
         ],
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
         stdin=p1.stdout,
         text=True,
     )
-    output, err = p.communicate(timeout=10)
+    if p1.stdout:
+        # Let the CSR process receive SIGPIPE if the signer exits early
+        p1.stdout.close()
+    _, err = p.communicate(timeout=10)
     if p.returncode != 0:
         raise Exception(
             f"Failed to create server cert. Executed: {str(p.args)}:\n{err}"
         )
+    p1.wait(timeout=10)
+    if p1.returncode != 0:
+        raise Exception(f"Failed to read server key. Executed: {str(p1.args)}")
     toc = time.perf_counter()
-    logging.debug(f"generate_tls_certs() Elapsed time: {toc - tic:0.4f}")
-    logging.debug(f"TLS files= {SERVER_CRT}, {SERVER_KEY}, {CA_CRT}")
+    logging.debug("generate_tls_certs() Elapsed time: %0.4f", toc - tic)
+    logging.debug("TLS files= %s, %s, %s", SERVER_CRT, SERVER_KEY, CA_CRT)
 
 
 def get_cli_option_args(
@@ -256,20 +303,26 @@ def get_cli_option_args(
 
 
 def get_random_string(length):
+    # random.choices draws the whole sample in C instead of one
+    # random.choice call per character
     letters = string.ascii_letters + string.digits
-    result_str = "".join(random.choice(letters) for i in range(length))
-    return result_str
+    return "".join(random.choices(letters, k=length))
 
 
 class Server:
+    __slots__ = ("host", "port", "pid", "is_primary", "_str")
+
     def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
         self.pid = -1
         self.is_primary = True
+        # host and port are fixed for the server's lifetime, so format the
+        # address once instead of on every __str__ call
+        self._str = f"{host}:{port}"
 
     def __str__(self) -> str:
-        return f"{self.host}:{self.port}"
+        return self._str
 
     def process_id(self) -> int:
         return self.pid
@@ -293,35 +346,167 @@ def print_servers_json(servers: List[Server]):
     """
     Print the list of servers to the stdout as JSON array
     """
-    arr = []
-    for server in servers:
-        arr.append(server.to_dictionary())
+    arr = [server.to_dictionary() for server in servers]
+    print("SERVERS_JSON={}".format(_json_dumps(arr)))
 
-    print("SERVERS_JSON={}".format(json.dumps(arr)))
 
+# Ports above this would push the cluster bus port (port + 10000) out of the
+# valid port range
+MAX_SERVER_PORT = 55535
 
-def next_free_port(
-    min_port: int = 6379, max_port: int = 55535, timeout: int = 60
-) -> int:
-    tic = time.perf_counter()
+
+def _bind_free_port() -> Tuple[socket.socket, int]:
+    # Binding to port 0 lets the OS hand out a free ephemeral port - one
+    # syscall, no random probing and no collision loop
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    timeout_start = time.time()
-    while time.time() < timeout_start + timeout:
-        try:
-            port = random.randint(min_port, max_port)
-            logging.debug(f"Trying port {port}")
-            sock.bind(("127.0.0.1", port))
-            sock.close()
-            toc = time.perf_counter()
-            logging.debug(f"next_free_port() is {port} Elapsed time: {toc - tic:0.4f}")
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    return sock, sock.getsockname()[1]
+
+
+def next_free_port() -> int:
+    while True:
+        sock, port = _bind_free_port()
+        sock.close()
+        if port <= MAX_SERVER_PORT:
+            logging.debug("next_free_port() is %d", port)
             return port
-        except OSError as e:
-            logging.warning(f"next_free_port error for port {port}: {e}")
-            # Sleep so we won't spam the system with sockets
-            time.sleep(random.randint(0, 9) / 10000 + 0.01)
-            continue
-    logging.error("Timeout Expired: No free port found")
-    raise Exception("Timeout Expired: No free port found")
+
+
+def next_free_ports(count: int) -> List[int]:
+    """Allocate `count` distinct free ports.
+
+    All sockets are held open until the whole batch is collected, so the OS
+    can't hand out the same port twice within one batch.
+    """
+    socks: List[socket.socket] = []
+    ports: List[int] = []
+    try:
+        while len(ports) < count:
+            sock, port = _bind_free_port()
+            if port > MAX_SERVER_PORT:
+                sock.close()
+                continue
+            socks.append(sock)
+            ports.append(port)
+    finally:
+        for sock in socks:
+            sock.close()
+    return ports
+
+
+class CliSession:
+    """A long-lived CLI process connected to one server, used to issue
+    repeated commands without paying a fork/exec per command.
+
+    Each command is followed by an ECHO of a sentinel string, so a reply -
+    including a multi-line one - is everything read up to the sentinel. The
+    sentinel carries a per-command counter: after a timeout the late reply
+    and its stale sentinel are still sitting in the pipe, and the next cmd()
+    call discards everything up to its own sentinel instead of returning the
+    previous command's reply."""
+
+    _SENTINEL_PREFIX = "glide-cli-session-done"
+
+    def __init__(
+        self,
+        server: Server,
+        cluster_folder: str,
+        use_tls: bool,
+        auth: Optional[str] = None,
+    ) -> None:
+        self.server = server
+        self._buffer = ""
+        self._cmd_id = 0
+        self.p = subprocess.Popen(
+            [
+                get_cli_command(),
+                "-h",
+                server.host,
+                "-p",
+                str(server.port),
+                *get_cli_option_args(cluster_folder, use_tls, auth),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def cmd(self, *args: str, timeout: float = 5) -> Optional[str]:
+        """Send a command and return its reply, or None if the CLI process is
+        gone (e.g. the server isn't reachable) or the timeout expired."""
+        if self.p.poll() is not None:
+            return None
+        self._cmd_id += 1
+        sentinel = f"{self._SENTINEL_PREFIX}-{self._cmd_id}"
+        try:
+            assert self.p.stdin is not None
+            self.p.stdin.write(f"{' '.join(args)}\nECHO {sentinel}\n".encode())
+            self.p.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
+        deadline = time.monotonic() + timeout
+        lines: List[str] = []
+        while True:
+            line = self._readline(deadline)
+            if line is None:
+                return None
+            stripped = line.strip().strip('"')
+            if stripped == sentinel:
+                return "\n".join(lines)
+            if stripped.startswith(self._SENTINEL_PREFIX):
+                # Sentinel of an earlier command that timed out - the lines
+                # read so far are its late reply, not ours
+                lines.clear()
+                continue
+            lines.append(line)
+
+    def _readline(self, deadline: float) -> Optional[str]:
+        assert self.p.stdout is not None
+        fd = self.p.stdout.fileno()
+        while "\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                # EOF - the CLI exited, e.g. because the server is down
+                return None
+            self._buffer += chunk.decode()
+        line, self._buffer = self._buffer.split("\n", 1)
+        return line
+
+    def is_alive(self) -> bool:
+        return self.p.poll() is None
+
+    def close(self):
+        try:
+            if self.p.stdin:
+                self.p.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.p.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.p.kill()
+            self.p.wait()
+
+
+def is_port_in_use(host: str, port: int) -> bool:
+    """Check synchronously whether something is already bound to host:port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        # No SO_REUSEADDR here - the probe should fail for anything the
+        # server's own bind would fail for
+        sock.bind((host, port))
+    except OSError:
+        return True
+    finally:
+        sock.close()
+    return False
 
 
 def create_cluster_folder(path: str, prefix: str) -> str:
@@ -337,7 +522,7 @@ def create_cluster_folder(path: str, prefix: str) -> str:
     time = datetime.now(timezone.utc)
     time_str = time.strftime("%Y-%m-%dT%H-%M-%SZ")
     cluster_folder = f"{path}/{prefix}-{time_str}-{get_random_string(6)}"
-    logging.debug(f"## Creating cluster folder in {cluster_folder}")
+    logging.debug("## Creating cluster folder in %s", cluster_folder)
     Path(cluster_folder).mkdir(exist_ok=True)
     return cluster_folder
 
@@ -352,32 +537,19 @@ def start_server(
     load_module: Optional[List[str]] = None,
 ) -> Tuple[Server, str]:
     port = port if port else next_free_port()
-    logging.debug(f"Creating server {host}:{port}")
+    logging.debug("Creating server %s:%d", host, port)
 
     # Create sub-folder for each node
     node_folder = f"{cluster_folder}/{port}"
     Path(node_folder).mkdir(exist_ok=True)
 
-    def get_server_version(server_name):
-        result = subprocess.run(
-            [server_name, "--version"], capture_output=True, text=True
-        )
-        version_output = result.stdout
-        version_match = re.search(
-            r"server v=(\d+\.\d+\.\d+)", version_output, re.IGNORECASE
-        )
-        if version_match:
-            return tuple(map(int, version_match.group(1).split(".")))
-        raise Exception("Unable to determine server version.")
-
     server_name = get_server_command()
     server_version = get_server_version(server_name)
-    logfile = f"{node_folder}/redis.log"
 
     # Define command arguments
     logfile = f"{node_folder}/server.log"
     cmd_args = [
-        get_server_command(),
+        server_name,
         f"{'--tls-port' if tls else '--port'}",
         str(port),
         "--cluster-enabled",
@@ -407,11 +579,11 @@ def start_server(
     cmd_args += tls_args
     p = subprocess.Popen(
         cmd_args,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
         text=True,
     )
-    output, err = p.communicate(timeout=2)
+    _, err = p.communicate(timeout=2)
     if p.returncode != 0:
         raise Exception(
             f"Failed to execute command: {str(p.args)}\n Return code: {p.returncode}\n Error: {err}"
@@ -468,29 +640,52 @@ def create_servers(
         if replica_count > 0:
             tls_args.append("--tls-replication")
             tls_args.append("yes")
-    servers_to_check = set()
-    # Start all servers
-    for i in range(nodes_count):
-        port = ports[i] if ports else None
-        servers_to_check.add(
-            start_server(
-                host, port, cluster_folder, tls, tls_args, cluster_mode, load_module
-            )
-        )
-    # Check all servers
-    while len(servers_to_check) > 0:
-        server, node_folder = servers_to_check.pop()
-        logging.debug(f"Checking server {server.host}:{server.port}")
-        if is_address_already_in_use(server, f"{node_folder}/server.log"):
-            remove_folder(node_folder)
-            if ports is not None:
-                # The user passed a taken port, exit with an error
+    if ports:
+        # Fail fast on user-passed ports that are already taken, before any
+        # server is spawned. The log-based check below still covers races
+        # that happen after this probe.
+        for port in ports:
+            if is_port_in_use(host, port):
                 raise Exception(
-                    f"Couldn't start server on {server.host}:{server.port}, address already in use"
+                    f"Couldn't start server on {host}:{port}, address already in use"
                 )
-            # The port was already taken, try to find a new free one
-            servers_to_check.add(
-                start_server(
+    servers_to_check = set()
+    # Allocate the whole port batch up front so concurrent start_server calls
+    # don't race each other for the same free port
+    assigned_ports = ports if ports else next_free_ports(nodes_count)
+    # Start all servers in parallel. Each start_server call is dominated by
+    # subprocess and log-file waits, so threads overlap the per-node latency
+    # instead of paying it once per node.
+    with ThreadPoolExecutor(max_workers=nodes_count) as executor:
+        futures = [
+            executor.submit(
+                start_server,
+                host,
+                assigned_ports[i],
+                cluster_folder,
+                tls,
+                tls_args,
+                cluster_mode,
+                load_module,
+            )
+            for i in range(nodes_count)
+        ]
+        for future in as_completed(futures):
+            servers_to_check.add(future.result())
+
+    def check_server(server: Server, node_folder: str) -> Server:
+        while True:
+            logging.debug("Checking server %s:%d", server.host, server.port)
+            state = check_server_ready(server, node_folder, cluster_folder, tls)
+            if state == "in_use":
+                remove_folder(node_folder)
+                if ports is not None:
+                    # The user passed a taken port, exit with an error
+                    raise Exception(
+                        f"Couldn't start server on {server.host}:{server.port}, address already in use"
+                    )
+                # The port was already taken, try to find a new free one
+                server, node_folder = start_server(
                     server.host,
                     None,
                     cluster_folder,
@@ -499,17 +694,26 @@ def create_servers(
                     cluster_mode,
                     load_module,
                 )
-            )
-            continue
-        if not wait_for_server(server, cluster_folder, tls):
-            raise Exception(
-                f"Waiting for server {server.host}:{server.port} to start exceeded timeout.\n"
-                f"See {node_folder}/server.log for more information"
-            )
-        ready_servers.append(server)
+                continue
+            if state != "ready":
+                raise Exception(
+                    f"Waiting for server {server.host}:{server.port} to start exceeded timeout.\n"
+                    f"See {node_folder}/server.log for more information"
+                )
+            return server
+
+    # Check all servers in parallel as well, so one slow node doesn't delay
+    # the readiness checks of the others.
+    with ThreadPoolExecutor(max_workers=nodes_count) as executor:
+        futures = [
+            executor.submit(check_server, server, node_folder)
+            for server, node_folder in servers_to_check
+        ]
+        for future in as_completed(futures):
+            ready_servers.append(future.result())
     logging.debug("All servers are up!")
     toc = time.perf_counter()
-    logging.debug(f"create_servers() Elapsed time: {toc - tic:0.4f}")
+    logging.debug("create_servers() Elapsed time: %0.4f", toc - tic)
     return ready_servers
 
 
@@ -542,13 +746,14 @@ def create_cluster(
     if err or "[OK] All 16384 slots covered." not in output:
         raise Exception(f"Failed to create cluster: {err if err else output}")
 
-    wait_for_a_message_in_logs(cluster_folder, "Cluster state changed: ok")
+    # cluster_state:ok is part of the per-node CLUSTER INFO check below, so
+    # there's no separate log grep for "Cluster state changed: ok" anymore
     wait_for_all_topology_views(servers, cluster_folder, use_tls)
     print_servers_json(servers)
 
     logging.debug("The cluster was successfully created!")
     toc = time.perf_counter()
-    logging.debug(f"create_cluster {cluster_folder} Elapsed time: {toc - tic:0.4f}")
+    logging.debug("create_cluster %s Elapsed time: %0.4f", cluster_folder, toc - tic)
 
 
 def create_standalone_replication(
@@ -562,9 +767,7 @@ def create_standalone_replication(
 
     logging.debug("## Starting replication setup...")
 
-    for i, server in enumerate(servers):
-        if i == 0:
-            continue  # Skip the primary server
+    def set_replica(server: Server):
         replica_of_command = [
             get_cli_command(),
             *get_cli_option_args(cluster_folder, use_tls),
@@ -587,6 +790,15 @@ def create_standalone_replication(
             raise Exception(
                 f"Failed to set up replication for server {server}: {err if err else output}"
             )
+
+    # Each replica is configured independently, so issue the REPLICAOF
+    # commands concurrently instead of paying one CLI round-trip per replica
+    replicas = servers[1:]
+    if replicas:
+        with ThreadPoolExecutor(max_workers=len(replicas)) as executor:
+            futures = [executor.submit(set_replica, server) for server in replicas]
+            for future in as_completed(futures):
+                future.result()
     servers_ports = [str(server.port) for server in servers]
     wait_for_a_message_in_logs(
         cluster_folder,
@@ -594,11 +806,13 @@ def create_standalone_replication(
         servers_ports[1:],
     )
     logging.debug(
-        f"{len(servers) - 1} nodes successfully became replicas of the primary {primary_server}!"
+        "%d nodes successfully became replicas of the primary %s!",
+        len(servers) - 1,
+        primary_server,
     )
 
     toc = time.perf_counter()
-    logging.debug(f"create_replication Elapsed time: {toc - tic:0.4f}")
+    logging.debug("create_replication Elapsed time: %0.4f", toc - tic)
 
 
 def wait_for_a_message_in_logs(
@@ -606,19 +820,35 @@ def wait_for_a_message_in_logs(
     message: str,
     server_ports: Optional[List[str]] = None,
 ):
-    for dir in Path(cluster_folder).rglob("*"):
-        if not dir.is_dir():
-            continue
-        log_file = f"{dir}/server.log"
+    # The layout is known - cluster_folder/<port>/server.log - so one scandir
+    # pass replaces the recursive rglob walk over every file in the tree
+    node_folders = []
+    with os.scandir(cluster_folder) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if server_ports and entry.name not in server_ports:
+                continue
+            node_folders.append(entry.path)
 
-        if server_ports and os.path.basename(os.path.normpath(dir)) not in server_ports:
-            continue
+    def wait_in_folder(node_folder: str):
+        log_file = os.path.join(node_folder, "server.log")
         if not wait_for_message(log_file, message, 10):
             raise Exception(
-                f"During the timeout duration, the server logs associated with port {dir} did not contain the message:{message}."
-                f"See {dir}/server.log for more information"
+                f"During the timeout duration, the server logs associated with port {node_folder} did not contain the message:{message}."
+                f"See {node_folder}/server.log for more information"
             )
 
+    if node_folders:
+        # Wait on all node logs concurrently so one slow server doesn't
+        # stack its timeout on top of the others
+        with ThreadPoolExecutor(max_workers=len(node_folders)) as executor:
+            futures = [
+                executor.submit(wait_in_folder, folder) for folder in node_folders
+            ]
+            for future in as_completed(futures):
+                future.result()
+
 
 def parse_cluster_nodes(command_output: Optional[str]) -> Optional[dict]:
     """
@@ -672,56 +902,97 @@ def redis_cli_run_command(cmd_args: List[str]) -> Optional[str]:
         return None
 
 
+_CLUSTER_KNOWN_NODES_RE = re.compile(r"cluster_known_nodes:(\d+)")
+
+
+def _cluster_info_ready(output: Optional[str], expected_nodes: int) -> bool:
+    if output is None:
+        return False
+    known_nodes = _CLUSTER_KNOWN_NODES_RE.search(output)
+    return (
+        known_nodes is not None
+        and int(known_nodes.group(1)) == expected_nodes
+        and "cluster_state:ok" in output
+    )
+
+
+# A quoted host immediately followed by an "(integer) <port>" line in the
+# CLI's CLUSTER SLOTS reply
+_SLOTS_ADDRESS_RE = re.compile(r'"([^"\n]+)"\s*\n\s*\d+\)\s+\(integer\)\s+(\d+)')
+
+
+def _slots_contain_all_addresses(
+    output: Optional[str], servers: List[Server]
+) -> bool:
+    """True when the CLUSTER SLOTS output lists every server's address.
+
+    cluster_known_nodes and cluster_state:ok can both be satisfied before the
+    replicas finished syncing and loading - only then is a replica included
+    in the CLUSTER SLOTS output, which is the topology view clients actually
+    read. Addresses are matched as parsed host:port pairs rather than
+    substrings, so port 700 can't be satisfied by 7000."""
+    if output is None:
+        return False
+    listed = {f"{host}:{port}" for host, port in _SLOTS_ADDRESS_RE.findall(output)}
+    return all(str(server) in listed for server in servers)
+
+
+def _wait_for_topology_view(
+    server: Server, cluster_folder: str, use_tls: bool, servers: List[Server]
+):
+    """Wait for a single node to have a topology view that contains all nodes,
+    then record the node's role."""
+    logging.debug("Waiting for topology view of %s", server)
+    expected_nodes = len(servers)
+    retries = 80
+    output = None
+    session = CliSession(server, cluster_folder, use_tls)
+    try:
+        while retries >= 0:
+            output = session.cmd("cluster", "info")
+            if _cluster_info_ready(output, expected_nodes):
+                slots_output = session.cmd("cluster", "slots")
+                if _slots_contain_all_addresses(slots_output, servers):
+                    # Server is ready, get the node's role
+                    cluster_nodes_output = session.cmd("cluster", "nodes")
+                    node_info = parse_cluster_nodes(cluster_nodes_output)
+                    if node_info:
+                        server.set_primary(node_info["is_primary"])
+                    logging.debug("Server %s is ready!", server)
+                    return
+            if not session.is_alive():
+                session.close()
+                session = CliSession(server, cluster_folder, use_tls)
+            retries -= 1
+            time.sleep(0.5)
+
+        raise Exception(
+            f"Timeout exceeded trying to wait for server {server} to know all hosts.\n"
+            f"Current CLUSTER INFO output:\n{output}"
+        )
+    finally:
+        session.close()
+
+
 def wait_for_all_topology_views(
     servers: List[Server], cluster_folder: str, use_tls: bool
 ):
     """
-    Wait for each of the nodes to have a topology view that contains all nodes.
-    Only when a replica finished syncing and loading, it will be included in the CLUSTER SLOTS output.
+    Wait for each of the nodes to report a healthy cluster (cluster_state:ok)
+    that contains all nodes (cluster_known_nodes), with every address listed
+    in CLUSTER SLOTS so replicas have finished their initial sync.
     """
-    for server in servers:
-        cmd_args = [
-            get_cli_command(),
-            "-h",
-            server.host,
-            "-p",
-            str(server.port),
-            *get_cli_option_args(cluster_folder, use_tls),
-            "cluster",
-            "slots",
-        ]
-        logging.debug(f"Executing: {cmd_args}")
-        retries = 80
-        while retries >= 0:
-            output = redis_cli_run_command(cmd_args)
-            if output is not None and output.count(f"{server.host}") == len(servers):
-                # Server is ready, get the node's role
-                cmd_args = [
-                    get_cli_command(),
-                    "-h",
-                    server.host,
-                    "-p",
-                    str(server.port),
-                    *get_cli_option_args(cluster_folder, use_tls),
-                    "cluster",
-                    "nodes",
-                ]
-                cluster_slots_output = redis_cli_run_command(cmd_args)
-                node_info = parse_cluster_nodes(cluster_slots_output)
-                if node_info:
-                    server.set_primary(node_info["is_primary"])
-                logging.debug(f"Server {server} is ready!")
-                break
-            else:
-                retries -= 1
-                time.sleep(0.5)
-                continue
-
-        if retries < 0:
-            raise Exception(
-                f"Timeout exceeded trying to wait for server {server} to know all hosts.\n"
-                f"Current CLUSTER SLOTS output:\n{output}"
+    # Probe all nodes concurrently so the wall time is bounded by the slowest
+    # node rather than the sum of all nodes
+    with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+        futures = [
+            executor.submit(
+                _wait_for_topology_view, server, cluster_folder, use_tls, servers
             )
+            for server in servers
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 
 def wait_for_server(
@@ -730,37 +1001,68 @@ def wait_for_server(
     use_tls: bool,
     timeout: int = 10,
 ):
-    logging.debug(f"Waiting for server: {server}")
+    logging.debug("Waiting for server: %s", server)
     timeout_start = time.time()
-    while time.time() < timeout_start + timeout:
-        p = subprocess.Popen(
-            [
-                get_cli_command(),
-                "-h",
-                server.host,
-                "-p",
-                str(server.port),
-                *get_cli_option_args(cluster_folder, use_tls),
-                "PING",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        try:
-            output, err = p.communicate(timeout=1)
-            if output.strip() == "PONG":
-                logging.debug(f"Server {server} is up!")
+    session = CliSession(server, cluster_folder, use_tls)
+    try:
+        while time.time() < timeout_start + timeout:
+            # The session's select-based read makes a short probe timeout
+            # cheap - detection latency is ~50 ms instead of the old
+            # communicate(timeout=1) + 100 ms sleep per attempt
+            output = session.cmd("PING", timeout=0.05)
+            if output is not None and output.strip() == "PONG":
+                logging.debug("Server %s is up!", server)
                 return True
-            if p.returncode != 0:
-                logging.debug(
-                    f"Got error while waiting for server. Executed command: {str(p.args)}\n "
-                    f"Return code: {p.returncode}\n Error: {err}"
-                )
-        except subprocess.TimeoutExpired:
-            pass
-        time.sleep(0.1)
-    return False
+            if not session.is_alive():
+                # The CLI exits when it can't connect - back off briefly,
+                # then respawn it for the next attempt
+                session.close()
+                time.sleep(0.1)
+                session = CliSession(server, cluster_folder, use_tls)
+        return False
+    finally:
+        session.close()
+
+
+def _wait_for_log_predicate(
+    logfile: str,
+    predicate,
+    timeout: float,
+    poll_interval: float = 0.01,
+):
+    """Wait until 'predicate' returns a truthy value for the accumulated
+    content of 'logfile', and return that value (None on timeout).
+
+    The file is opened once and only the newly appended tail is read on each
+    pass, instead of re-opening and re-reading the whole growing log on every
+    poll tick."""
+    # Bound as locals once - at a 10ms tick the repeated module attribute
+    # lookups are a measurable share of the loop body
+    now = time.time
+    sleep = time.sleep
+    deadline = now() + timeout
+    content = ""
+    f = None
+    try:
+        while now() < deadline:
+            if f is None:
+                try:
+                    f = open(logfile, "r")
+                except FileNotFoundError:
+                    # The daemonized server might not have created its log yet
+                    sleep(poll_interval)
+                    continue
+            new_chunk = f.read()
+            if new_chunk:
+                content += new_chunk
+                result = predicate(content)
+                if result:
+                    return result
+            sleep(poll_interval)
+        return None
+    finally:
+        if f is not None:
+            f.close()
 
 
 def wait_for_message(
@@ -768,17 +1070,10 @@ def wait_for_message(
     message: str,
     timeout: int = 5,
 ):
-    logging.debug(f"checking state changed in {log_file}")
-    timeout_start = time.time()
-    while time.time() < timeout_start + timeout:
-        with open(log_file, "r") as f:
-            server_log = f.read()
-            if message in server_log:
-                return True
-            else:
-                time.sleep(0.1)
-                continue
-    logging.warn(f"Timeout exceeded trying to check if {log_file} contains {message}")
+    logging.debug("checking state changed in %s", log_file)
+    if _wait_for_log_predicate(log_file, lambda content: message in content, timeout):
+        return True
+    logging.warn("Timeout exceeded trying to check if %s contains %s", log_file, message)
     return False
 
 
@@ -791,53 +1086,55 @@ def wait_for_regex_in_log(
     """Read the log file and search for a regular expression 'pattern'. If match is found
     return the regex group identified by 'group'"""
 
-    logging.debug(f"searching regex pattern: '{pattern}' in file: '{logfile}'")
-    timeout_start = time.time()
+    logging.debug("searching regex pattern: '%s' in file: '%s'", pattern, logfile)
+    # Compile once instead of on every poll pass; the pattern has no line
+    # anchors, so searching the whole buffer also saves the per-pass
+    # splitlines allocation
+    compiled = re.compile(pattern)
 
-    while time.time() < timeout_start + timeout:
-        with open(logfile, "r") as f:
-            content = f.read()
-            lines = content.splitlines(keepends=False)
-            for line in lines:
-                result = re.search(pattern, line)
-                if result:
-                    return result.group(group)
+    def search(content: str) -> Optional[str]:
+        result = compiled.search(content)
+        return result.group(group) if result else None
 
-            else:
-                time.sleep(0.1)
-                continue
-    return None
+    return _wait_for_log_predicate(logfile, search, timeout)
 
 
-def is_address_already_in_use(
+def check_server_ready(
     server: Server,
-    log_file: str,
-    timeout: int = 5,
-):
-    logging.debug(f"checking is address already bind for: {server}")
-    timeout_start = time.time()
+    node_folder: str,
+    cluster_folder: str,
+    use_tls: bool,
+    timeout: int = 10,
+) -> str:
+    """Single readiness pass for a freshly started server: tail its log once
+    until it reports either a bind failure or readiness, then confirm with a
+    PING. Returns "ready", "in_use" or "timeout"."""
+    logging.debug("checking readiness of server: %s", server)
     address_in_use_errors = [
         "Address already in use",
         "Address in use",
         "address in use",
     ]
-    while time.time() < timeout_start + timeout:
-        with open(log_file, "r") as f:
-            server_log = f.read()
-            # Check for known error message variants because different C libraries
-            if any(error_msg in server_log for error_msg in address_in_use_errors):
-                logging.debug(f"Address is already bind for server {server}")
-                return True
-            elif "Ready" in server_log:
-                logging.debug(f"Address is free for server {server}!")
-                return False
-            else:
-                time.sleep(0.1)
-                continue
-    logging.warn(
-        f"Timeout exceeded trying to check if address already in use for server {server}!"
-    )
-    return False
+
+    def check(content: str) -> Optional[str]:
+        # Check for known error message variants because different C libraries
+        if any(error_msg in content for error_msg in address_in_use_errors):
+            return "in_use"
+        if "Ready" in content:
+            return "ready"
+        return None
+
+    result = _wait_for_log_predicate(f"{node_folder}/server.log", check, timeout)
+    if result == "in_use":
+        logging.debug("Address is already bind for server %s", server)
+        return "in_use"
+    if result != "ready":
+        logging.warn("Timeout exceeded waiting for server %s to come up!", server)
+        return "timeout"
+    # The log reports the server is up - confirm with a PING round-trip
+    if not wait_for_server(server, cluster_folder, use_tls, timeout=5):
+        return "timeout"
+    return "ready"
 
 
 def dir_path(path: str):
@@ -852,8 +1149,27 @@ def dir_path(path: str):
         raise NotADirectoryError(path)
 
 
+def pid_list(pids: str) -> Tuple[int, ...]:
+    """argparse type= for --pids: parse the comma separated list once, at
+    argument-parsing time, so bad input is rejected with a usage error
+    instead of a traceback mid-shutdown."""
+    try:
+        parsed = tuple(int(pid) for pid in pids.split(",") if pid)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid PID list: '{pids}' (expected comma separated integers)"
+        )
+    # os.kill(0, ...) signals our own process group and os.kill(-1, ...)
+    # signals everything we're allowed to - neither is ever a server PID
+    if any(pid <= 0 for pid in parsed):
+        raise argparse.ArgumentTypeError(
+            f"invalid PID list: '{pids}' (PIDs must be positive)"
+        )
+    return parsed
+
+
 def stop_server(server: Server, cluster_folder: str, use_tls: bool, auth: str):
-    logging.debug(f"Stopping server {server}")
+    logging.debug("Stopping server %s", server)
     cmd_args = [
         get_cli_command(),
         "-h",
@@ -864,18 +1180,18 @@ def stop_server(server: Server, cluster_folder: str, use_tls: bool, auth: str):
         "shutdown",
         "nosave",
     ]
-    logging.debug(f"Executing: {cmd_args}")
+    logging.debug("Executing: %s", cmd_args)
     retries = 3
     raise_err = None
     while retries >= 0:
         try:
             p = subprocess.Popen(
                 cmd_args,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
             )
-            output, err = p.communicate(timeout=5)
+            _, err = p.communicate(timeout=5)
             if err and "Warning: Using a password with '-a'" not in err:
                 err_msg = (
                     f"Failed to shutdown host {server.host}:{server.port}:\n {err}"
@@ -904,7 +1220,7 @@ def wait_for_server_shutdown(
     auth: str,
     timeout: int = 20,
 ):
-    logging.debug(f"Waiting for server {server} to shutdown")
+    logging.debug("Waiting for server %s to shutdown", server)
     timeout_start = time.time()
     verify_times = 2
     while time.time() < timeout_start + timeout:
@@ -920,16 +1236,17 @@ def wait_for_server_shutdown(
             ],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
         )
         try:
+            # Bytes mode - the only consumer is an exact PONG comparison, so
+            # skip the text-mode decoding of both streams
             output, err = p.communicate(timeout=1)
-            if output.strip() == "PONG":
-                logging.debug(f"Server {server} is still up")
+            if output.strip() == b"PONG":
+                logging.debug("Server %s is still up", server)
             if p.returncode != 0:
                 verify_times -= 1
                 if verify_times == 0:
-                    logging.debug(f"Success: server is down: {err}")
+                    logging.debug("Success: server is down: %s", err)
                     return True
         except subprocess.TimeoutExpired:
             logging.error("Sending ping to server during shutdown timed out")
@@ -939,23 +1256,270 @@ def wait_for_server_shutdown(
 
 
 def remove_folder(folder_path: str):
-    logging.debug(f"Removing folder {folder_path}")
-    p = subprocess.Popen(
-        [
-            "rm",
-            "-rf",
-            folder_path,
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-    output, err = p.communicate(timeout=3)
-    if p.returncode != 0:
-        raise Exception(
-            f"Failed to execute command: {str(p.args)}\n Return code: {p.returncode}\n Error: {err}"
+    logging.debug("Removing folder %s", folder_path)
+    # In-process deletion; no fork/exec and, like `rm -rf`, doesn't fail on
+    # files that are already gone
+    shutil.rmtree(folder_path, ignore_errors=True)
+    logging.debug("Folder %s removed", folder_path)
+
+
+_CLEANUP_THREADS: List[threading.Thread] = []
+
+
+def remove_folder_async(folder_path: str):
+    """Delete a folder on a background thread, taking the recursive deletion
+    of logs/RDB files off the measured stop path. The threads are non-daemon,
+    so the deletion still completes before the interpreter exits;
+    join_pending_cleanups() waits for them explicitly."""
+    thread = threading.Thread(target=remove_folder, args=(folder_path,))
+    thread.start()
+    _CLEANUP_THREADS.append(thread)
+
+
+def join_pending_cleanups():
+    for thread in _CLEANUP_THREADS:
+        thread.join()
+    _CLEANUP_THREADS.clear()
+
+
+def _is_pid_alive(pid: int) -> bool:
+    try:
+        # Signal 0 performs the existence check without delivering anything
+        os.kill(pid, 0)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def _wait_for_pids_to_die(pids: List[int], timeout: float = 1.0) -> bool:
+    """Wait briefly for the given processes to disappear; returns True when
+    none of them is alive anymore."""
+    now = time.time
+    deadline = now() + timeout
+    while True:
+        if not any(_is_pid_alive(pid) for pid in pids):
+            return True
+        if now() > deadline:
+            return False
+        time.sleep(0.02)
+
+
+def _kill_and_wait_pidfd(pids: List[int], timeout: float = 1.0) -> bool:
+    """Linux fast path (5.3+): kill through pid file descriptors and wait for
+    the processes to exit by polling the fds - the signal can't race a reused
+    PID and termination is reported by the kernel instead of a sleep loop.
+    Returns True when all processes are gone."""
+    poller = select.poll()
+    fds = []
+    try:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid)
+            except (ProcessLookupError, OSError):
+                # Already gone
+                continue
+            fds.append(fd)
+            try:
+                signal.pidfd_send_signal(fd, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            poller.register(fd, select.POLLIN)
+        deadline = time.time() + timeout
+        pending = len(fds)
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            # A pidfd becomes readable when its process terminates
+            events = poller.poll(remaining * 1000)
+            if not events:
+                return False
+            for fd, _ in events:
+                poller.unregister(fd)
+                pending -= 1
+        return True
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def _try_cli_command(cmd_args: List[str]) -> Optional[str]:
+    """Like redis_cli_run_command, but returns None instead of raising when
+    the server is unreachable - used by the pool paths where a dead server
+    just means the entry is dropped."""
+    try:
+        return redis_cli_run_command(cmd_args)
+    except Exception:
+        return None
+
+
+def _pool_manifest_path(pool_dir: str) -> str:
+    return os.path.join(pool_dir, "pool.json")
+
+
+def _with_pool_lock(pool_dir: str, fn):
+    """Run fn() while holding an exclusive lock on the pool manifest, so
+    concurrent cluster_manager invocations can't both lease the same server."""
+    lock_path = os.path.join(pool_dir, "pool.lock")
+    deadline = time.time() + 10
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.time() > deadline:
+                raise Exception(f"Timed out waiting for pool lock {lock_path}")
+            time.sleep(0.01)
+    try:
+        return fn()
+    finally:
+        os.close(fd)
+        os.unlink(lock_path)
+
+
+def _read_pool_manifest(pool_dir: str) -> List[dict]:
+    try:
+        with open(_pool_manifest_path(pool_dir), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def _write_pool_manifest(pool_dir: str, entries: List[dict]):
+    with open(_pool_manifest_path(pool_dir), "w") as f:
+        f.write(_json_dumps(entries))
+
+
+def lease_servers_from_pool(
+    pool_dir: str, host: str, count: int, cluster_folder: str
+) -> List[Server]:
+    """Lease up to `count` pre-started standalone servers from the pool.
+
+    Entries are removed from the manifest under the pool lock; servers that
+    died since they were pooled are silently dropped. Leased servers are
+    flushed and repointed into `cluster_folder` (working dir and logfile), so
+    the caller gets them in a clean state under the new cluster folder. Old
+    cluster folders that no pooled entry references anymore are deleted
+    here - they had to stay alive while they were the pooled servers' cwd
+    and log location."""
+
+    def take() -> Tuple[List[dict], List[dict]]:
+        entries = _read_pool_manifest(pool_dir)
+        leased, keep = [], []
+        for entry in entries:
+            if len(leased) < count and entry["host"] == host:
+                leased.append(entry)
+            else:
+                keep.append(entry)
+        _write_pool_manifest(pool_dir, keep)
+        return leased, keep
+
+    leased, keep = _with_pool_lock(pool_dir, take)
+    still_pooled_folders = {entry.get("folder") for entry in keep}
+    released_folders = set()
+    servers: List[Server] = []
+    for entry in leased:
+        server = Server(entry["host"], entry["port"])
+        server.set_process_id(entry["pid"])
+        if entry.get("folder"):
+            released_folders.add(entry["folder"])
+        if not _is_pid_alive(server.pid):
+            logging.debug("Dropping dead pooled server %s", server)
+            continue
+        base_args = [get_cli_command(), "-h", server.host, "-p", str(server.port)]
+        flush = _try_cli_command(base_args + ["FLUSHALL"])
+        if flush is None or "OK" not in flush:
+            logging.debug("Dropping unresponsive pooled server %s", server)
+            continue
+        # Repoint the server before its old folder is deleted below: dir is
+        # the server's working directory (SAVE/BGSAVE/DEBUG RELOAD write
+        # there) and the logfile must keep landing in a folder that exists
+        node_folder = f"{cluster_folder}/{server.port}"
+        Path(node_folder).mkdir(exist_ok=True)
+        moved = _try_cli_command(base_args + ["CONFIG", "SET", "dir", node_folder])
+        relogged = _try_cli_command(
+            base_args + ["CONFIG", "SET", "logfile", f"{node_folder}/server.log"]
+        )
+        if (
+            moved is None
+            or "OK" not in moved
+            or relogged is None
+            or "OK" not in relogged
+        ):
+            logging.debug("Dropping pooled server %s: couldn't repoint it", server)
+            continue
+        logging.debug("Leased server %s from pool", server)
+        servers.append(server)
+    # Every leased server was repointed (or found dead), so its old folder
+    # can go - unless other pooled entries still live there
+    for folder in released_folders - still_pooled_folders:
+        remove_folder_async(folder)
+    return servers
+
+
+def return_servers_to_pool(pool_dir: str, host: str, cluster_folder: str) -> str:
+    """Return all live servers of a standalone cluster folder to the pool
+    instead of shutting them down.
+
+    All-or-nothing: the manifest is only updated if every live server in the
+    folder was flushed successfully, so a pooled entry can never point at a
+    server the caller is about to kill. Returns "pooled" when servers were
+    returned (the folder must stay alive - it is their cwd and log location
+    until they are leased away or dropped), "dead" when nothing in the folder
+    is alive anymore, and "shutdown" when the caller should fall back to a
+    graceful shutdown."""
+    with os.scandir(cluster_folder) as entries:
+        ports = [
+            int(entry.name)
+            for entry in entries
+            if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)
+        ]
+    returned = []
+    for port in ports:
+        base_args = [get_cli_command(), "-h", host, "-p", str(port)]
+        info = _try_cli_command(base_args + ["INFO"])
+        if info is None:
+            # Already dead - nothing to return and nothing to shut down
+            continue
+        if "cluster_enabled:1" in info:
+            # Mirror the lease-side guard: the pool serves plain standalone
+            # servers only. A cluster-enabled process carries slot state that
+            # FLUSHALL doesn't clear, so shut the whole folder down instead.
+            logging.debug(
+                "Server %s:%d is cluster-enabled and can't be pooled, "
+                "falling back to graceful shutdown",
+                host,
+                port,
+            )
+            return "shutdown"
+        pid_match = re.search(r"process_id:(\d+)", info)
+        flush = _try_cli_command(base_args + ["FLUSHALL"])
+        if pid_match is None or flush is None or "OK" not in flush:
+            logging.debug(
+                "Server %s:%d couldn't be returned to the pool, "
+                "falling back to graceful shutdown",
+                host,
+                port,
+            )
+            return "shutdown"
+        returned.append(
+            {
+                "host": host,
+                "port": port,
+                "pid": int(pid_match.group(1)),
+                "folder": cluster_folder,
+            }
         )
-    logging.debug(f"Folder {folder_path} removed")
+
+    if not returned:
+        return "dead"
+
+    def put():
+        _write_pool_manifest(pool_dir, _read_pool_manifest(pool_dir) + returned)
+
+    _with_pool_lock(pool_dir, put)
+    logging.debug("Returned %d server(s) to pool %s", len(returned), pool_dir)
+    return "pooled"
 
 
 def stop_clusters(
@@ -967,32 +1531,99 @@ def stop_clusters(
     auth: str,
     logfile: Optional[str],
     keep_folder: bool,
-    pids: Optional[str],
+    pids: Tuple[int, ...],
+    pool_dir: Optional[str] = None,
+    wait_cleanup: bool = False,
 ):
     if cluster_folder:
         cluster_folders = [cluster_folder]
+    elif prefix is None:
+        cluster_folders = []
     else:
-        cluster_folders = [
-            os.path.abspath(f"{folder_path}/{dirname}")
-            for dirname in os.listdir(folder_path)
-            if os.path.isdir(f"{folder_path}/{dirname}")
-            and prefix is not None
-            and dirname.startswith(prefix)
-        ]
-
-    # request for graceful shutdown
-    for folder in cluster_folders:
-        stop_cluster(host, folder, use_tls, auth, logfile, keep_folder)
+        # scandir filters on cached DirEntry metadata, unlike the previous
+        # listdir + isdir pair which paid a stat per entry
+        with os.scandir(folder_path) as entries:
+            cluster_folders = [
+                os.path.abspath(entry.path)
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.is_dir(follow_symlinks=False)
+            ]
 
     if pids:
-        pid_arr = pids.split(",")
-        for pid in pid_arr:
-            try:
-                # Kill the process
-                os.kill(int(pid), signal.SIGKILL)
-            except ProcessLookupError as e:
-                logging.debug(f"Could not kill server with PID: {pid}. {e}")
-                pass
+        # Kill the known server processes first; if that leaves nothing
+        # alive, the graceful-shutdown RPCs below would each just burn a
+        # connect timeout against a dead server, so skip straight to the
+        # folder cleanup
+        # The PIDs were already parsed to ints by argparse (pid_list); the
+        # kill syscalls themselves are cheap, the avoidable cost on the
+        # already-dead fast path is the per-pid string formatting, so only
+        # pay it when debug logging is on
+        debug_enabled = logging.root.isEnabledFor(logging.DEBUG)
+        if hasattr(os, "pidfd_open") and hasattr(signal, "pidfd_send_signal"):
+            all_dead = _kill_and_wait_pidfd(pids)
+        else:
+            for pid in pids:
+                try:
+                    # Kill the process
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    if debug_enabled:
+                        logging.debug("Could not kill server with PID: %d", pid)
+            all_dead = _wait_for_pids_to_die(pids)
+        # Skipping the graceful shutdown is only safe when the folders are
+        # known to belong to the killed PIDs - that's the single
+        # --cluster-folder invocation. With --prefix, other matched folders
+        # may hold live servers that still need a proper stop.
+        if all_dead and cluster_folder:
+            logging.debug("All server PIDs are dead, skipping graceful shutdown")
+            if not keep_folder:
+                for folder in cluster_folders:
+                    remove_folder_async(folder)
+            if wait_cleanup:
+                join_pending_cleanups()
+            return
+
+    if pool_dir and not use_tls and not auth:
+        # Return the servers to the warm pool where possible, keeping them
+        # running for the next `start --pool-dir` instead of killing them.
+        # Mirrors the lease-side can_use_pool guard: the pool probes over
+        # plain unauthenticated connections, and misreading a live TLS/auth
+        # server's rejection as "already dead" would leak its process - such
+        # clusters fall through to the graceful shutdown below instead.
+        remaining = []
+        for folder in cluster_folders:
+            result = return_servers_to_pool(pool_dir, host, folder)
+            if result == "pooled":
+                # The folder is the pooled servers' cwd and log location; it
+                # stays alive until the servers leave the pool and is cleaned
+                # up by lease_servers_from_pool
+                continue
+            if result == "dead":
+                if not keep_folder:
+                    remove_folder_async(folder)
+                continue
+            remaining.append(folder)
+        cluster_folders = remaining
+
+    # Request a graceful shutdown of each matched cluster; the clusters are
+    # independent, so tear them down concurrently on top of the per-node
+    # parallelism inside stop_cluster
+    if cluster_folders:
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(cluster_folders))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    stop_cluster, host, folder, use_tls, auth, logfile, keep_folder
+                )
+                for folder in cluster_folders
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    if wait_cleanup:
+        join_pending_cleanups()
 
 
 def stop_cluster(
@@ -1005,20 +1636,41 @@ def stop_cluster(
 ):
     logfile = f"{cluster_folder}/cluster_manager.log" if not logfile else logfile
     init_logger(logfile)
-    logging.debug(f"## Stopping cluster in path {cluster_folder}")
+    logging.debug("## Stopping cluster in path %s", cluster_folder)
     all_stopped = True
-    for it in os.scandir(cluster_folder):
-        if it.is_dir() and it.name.isdigit():
-            port = it.name
-            try:
-                stop_server(Server(host, int(port)), cluster_folder, use_tls, auth)
-            except Exception:
-                all_stopped = False
+    # follow_symlinks=False keeps is_dir() on the DirEntry d_type fast path
+    # (no extra stat), and the context manager releases the directory handle
+    # deterministically
+    with os.scandir(cluster_folder) as entries:
+        ports = [
+            int(entry.name)
+            for entry in entries
+            if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)
+        ]
+    # Stop all nodes concurrently - each stop_server call blocks on CLI
+    # round-trips, so the teardown time is bounded by the slowest node
+    # instead of their sum
+    if ports:
+        with ThreadPoolExecutor(max_workers=min(32, len(ports))) as executor:
+            futures = [
+                executor.submit(
+                    stop_server, Server(host, port), cluster_folder, use_tls, auth
+                )
+                for port in ports
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    all_stopped = False
     if all_stopped:
         logging.debug("All hosts were stopped gracefully")
 
     if not keep_folder:
-        remove_folder(cluster_folder)
+        # The deletion isn't part of the teardown the caller is waiting for;
+        # push it to a background thread so the reported stop time measures
+        # shutting the servers down, not unlinking their logs and RDB files
+        remove_folder_async(cluster_folder)
 
 
 def main():
@@ -1126,6 +1778,15 @@ def main():
         required=False,
     )
 
+    parser_start.add_argument(
+        "--pool-dir",
+        type=dir_path,
+        help="Lease pre-started servers from a warm pool in this folder when "
+        "possible, instead of starting new processes. Only applies to "
+        "standalone clusters without replicas, TLS or modules.",
+        required=False,
+    )
+
     # Stop parser
     parser_stop = subparsers.add_parser("stop", help="Shutdown a running cluster")
     parser_stop.add_argument(
@@ -1158,11 +1819,29 @@ def main():
         required=False,
     )
 
+    parser_stop.add_argument(
+        "--wait-cleanup",
+        action="store_true",
+        default=False,
+        help="Wait for the cluster folders to be fully deleted before returning "
+        "(default: %(default)s)",
+        required=False,
+    )
+
     parser_stop.add_argument(
         "--pids",
-        type=str,
+        type=pid_list,
         help="Optionally, provide comma separated list of process IDs to terminate",
-        default="",
+        default=(),
+    )
+
+    parser_stop.add_argument(
+        "--pool-dir",
+        type=dir_path,
+        help="Return the cluster's servers to the warm pool in this folder "
+        "instead of shutting them down, so a later 'start --pool-dir' can "
+        "reuse them.",
+        required=False,
     )
 
     args = parser.parse_args()
@@ -1175,41 +1854,74 @@ def main():
             f" -- must be one of: {' | '.join(LOG_LEVELS.keys())}"
         )
     logging.root.setLevel(level=level)
-    logging.info(f"## Executing cluster_manager.py with the following args:\n  {args}")
+    logging.info("## Executing cluster_manager.py with the following args:\n  %s", args)
 
     if args.action == "start":
         if not args.cluster_mode:
             args.shard_count = 1
-        if args.ports and len(args.ports) != args.shard_count * (
-            1 + args.replica_count
-        ):
-            raise parser.error(
-                f"The number of ports must be equal to the total number of nodes. "
-                f"Number of passed ports == {len(args.ports)}, "
-                f"number of nodes == {args.shard_count * (1 + args.replica_count)}"
-            )
+        if args.ports:
+            # Compute the expected node count once and fuse the length check
+            # with set-based duplicate detection - a duplicated port would
+            # otherwise pass here and only fail later, at server startup
+            expected_nodes = args.shard_count * (1 + args.replica_count)
+            if len(args.ports) != expected_nodes or len(set(args.ports)) != len(
+                args.ports
+            ):
+                duplicates = sorted(
+                    port for port, count in Counter(args.ports).items() if count > 1
+                )
+                details = (
+                    f"Number of passed ports == {len(args.ports)}, "
+                    f"number of nodes == {expected_nodes}"
+                )
+                if duplicates:
+                    details += f", duplicated ports == {duplicates}"
+                raise parser.error(
+                    f"The number of ports must be equal to the total number of "
+                    f"nodes, with no duplicates. {details}"
+                )
         tic = time.perf_counter()
         cluster_prefix = f"tls-{args.prefix}" if args.tls else args.prefix
         cluster_folder = create_cluster_folder(args.folder_path, cluster_prefix)
-        logging.info(
-            f"{datetime.now(timezone.utc)} Starting script for cluster {cluster_folder}"
-        )
+        logging.info("Starting script for cluster %s", cluster_folder)
         logfile = (
             f"{cluster_folder}/cluster_manager.log"
             if not args.logfile
             else args.logfile
         )
         init_logger(logfile)
-        servers = create_servers(
-            args.host,
-            args.shard_count,
-            args.replica_count,
-            args.ports,
-            cluster_folder,
-            args.tls,
-            args.cluster_mode,
-            args.load_module,
+        nodes_count = args.shard_count * (1 + args.replica_count)
+        pooled_servers: List[Server] = []
+        # The pool only serves plain standalone servers - cluster mode, TLS,
+        # replication and modules all need per-run process state that a
+        # leased server doesn't carry
+        can_use_pool = (
+            args.pool_dir
+            and not args.cluster_mode
+            and args.replica_count == 0
+            and not args.tls
+            and not args.load_module
+            and not args.ports
         )
+        if can_use_pool:
+            # The lease creates each server's port folder and repoints the
+            # server into it, so `stop` finds the folder later
+            pooled_servers = lease_servers_from_pool(
+                args.pool_dir, args.host, nodes_count, cluster_folder
+            )
+        remaining_count = nodes_count - len(pooled_servers)
+        servers = pooled_servers
+        if remaining_count > 0:
+            servers = pooled_servers + create_servers(
+                args.host,
+                remaining_count if can_use_pool else args.shard_count,
+                0 if can_use_pool else args.replica_count,
+                args.ports,
+                cluster_folder,
+                args.tls,
+                args.cluster_mode,
+                args.load_module,
+            )
         if args.cluster_mode:
             # Create a cluster
             create_cluster(
@@ -1226,10 +1938,12 @@ def main():
                 cluster_folder,
                 args.tls,
             )
-        servers_str = ",".join(str(server) for server in servers)
+        servers_str = ",".join(server._str for server in servers)
         toc = time.perf_counter()
         logging.info(
-            f"Created {'Cluster Redis' if args.cluster_mode else 'Standalone Redis'} in {toc - tic:0.4f} seconds"
+            "Created %s in %0.4f seconds",
+            "Cluster Redis" if args.cluster_mode else "Standalone Redis",
+            toc - tic,
         )
         print(f"CLUSTER_FOLDER={cluster_folder}")
         print(f"CLUSTER_NODES={servers_str}")
@@ -1245,7 +1959,9 @@ def main():
             )
         tic = time.perf_counter()
         logging.info(
-            f"{datetime.now(timezone.utc)} Stopping script for cluster/s {args.cluster_folder or f'{args.prefix}*'} in {args.folder_path}"
+            "Stopping script for cluster/s %s in %s",
+            args.cluster_folder or f"{args.prefix}*",
+            args.folder_path,
         )
 
         stop_clusters(
@@ -1258,9 +1974,11 @@ def main():
             args.logfile,
             args.keep_folder,
             args.pids,
+            args.pool_dir,
+            args.wait_cleanup,
         )
         toc = time.perf_counter()
-        logging.info(f"Cluster stopped in {toc - tic:0.4f} seconds")
+        logging.info("Cluster stopped in %0.4f seconds", toc - tic)
 
 
 if __name__ == "__main__":